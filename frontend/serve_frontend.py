@@ -1,32 +1,284 @@
 #!/usr/bin/env python3
+import asyncio
+import collections
+import datetime
+import email.utils
 import http.server
-import socketserver
+import io
+import mmap
+import shutil
+import stat
+import threading
 import webbrowser
 import os
 import sys
 from urllib.parse import urlparse
 
+try:
+    from aiohttp import web
+except ImportError:
+    # aiohttp is optional; without it we fall back to the stdlib server
+    web = None
+
+try:
+    import uvloop
+except ImportError:
+    # Optional faster event loop for the aiohttp server
+    uvloop = None
+
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+# Files above this size are handed to the kernel with sendfile(); smaller
+# ones are cheaper to push through a plain write.
+SENDFILE_MIN_SIZE = 64 * 1024
+
+# Medium files that don't go through sendfile() are written straight from a
+# read-only mapping of the page cache instead of a fresh heap buffer. The
+# mapping is closed as soon as the write is done: on Windows an open mapping
+# blocks editors from saving the file, and on POSIX a file truncated while
+# mapped faults (SIGBUS) on access, so none is kept between requests.
+MMAP_MIN_SIZE = 4 * 1024
+MMAP_MAX_SIZE = 1024 * 1024
+
+# Everything else is copied with a larger buffer than shutil's default
+# (64 KiB on POSIX) to cut read/write syscalls on big files
+COPY_BUFSIZE = 1024 * 1024
+
+# Guards the small-file cache; requests are handled on one thread per connection
+_CACHE_LOCK = threading.Lock()
+
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 15
+
+# Small files (the HTML/JS/CSS making up the UI) are kept in memory together
+# with their pre-rendered headers, so a hit costs one stat() and one write.
+SMALL_FILE_MAX_SIZE = SENDFILE_MIN_SIZE
+FILE_CACHE_LIMIT = 20 * 1024 * 1024
+
+CachedFile = collections.namedtuple(
+    "CachedFile", ["mtime_ns", "etag", "last_modified", "headers", "body"]
+)
+
+# path -> CachedFile
+_FILE_CACHE = {}
+_file_cache_size = 0
+
+
+def cache_small_file(path, st, content_type, last_modified):
+    """Read a small file into the cache; return None once the cache is full."""
+    global _file_cache_size
+    with open(path, "rb") as f:
+        body = f.read()
+    etag = f'"{st.st_mtime_ns:x}-{len(body):x}"'
+    header_lines = [
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Last-Modified: {last_modified}",
+        f"ETag: {etag}",
+    ]
+    header_lines += [f"{name}: {value}" for name, value in CORS_HEADERS.items()]
+    headers = ("\r\n".join(header_lines) + "\r\n\r\n").encode("latin-1")
+
+    entry = CachedFile(st.st_mtime_ns, etag, last_modified, headers, body)
+    with _CACHE_LOCK:
+        stale = _FILE_CACHE.get(path)
+        stale_size = len(stale.body) if stale is not None else 0
+        if _file_cache_size - stale_size + len(body) > FILE_CACHE_LIMIT:
+            return None
+        _FILE_CACHE[path] = entry
+        _file_cache_size += len(body) - stale_size
+    return entry
+
 
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Persistent connections let the browser fetch all assets over one socket
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and body go out as separate writes; without TCP_NODELAY the
+    # body can sit behind Nagle + delayed ACK for ~40ms
+    disable_nagle_algorithm = True
+
+    # guess_type() consults this table by extension before mimetypes, so the
+    # common frontend types resolve with a single dict lookup
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        ".css": "text/css",
+        ".js": "application/javascript",
+        ".html": "text/html",
+        ".wasm": "application/wasm",
+    }
+
+    def confirm_keep_alive(self):
+        # HTTP/1.0 clients asking for keep-alive only reuse the socket if the
+        # response says so; for HTTP/1.1 it is the default.
+        return self.request_version == "HTTP/1.0" and not self.close_connection
+
     def end_headers(self):
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        for name, value in CORS_HEADERS.items():
+            self.send_header(name, value)
+        if self.confirm_keep_alive():
+            self.send_header("Connection", "keep-alive")
         super().end_headers()
 
     def do_OPTIONS(self):
         self.send_response(200)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
-    def guess_type(self, path):
-        mimetype = super().guess_type(path)
-        if path.endswith(".css"):
-            return "text/css"
-        elif path.endswith(".js"):
-            return "application/javascript"
-        elif path.endswith(".html"):
-            return "text/html"
-        return mimetype
+    def do_GET(self):
+        if not self.send_cached():
+            super().do_GET()
+
+    def send_cached(self):
+        """Answer a GET from the small-file cache; return False on a miss."""
+        path = self.translate_path(self.path)
+        if path.endswith("/"):
+            path = os.path.join(path, "index.html")
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if not stat.S_ISREG(st.st_mode) or st.st_size > SMALL_FILE_MAX_SIZE:
+            return False
+
+        entry = _FILE_CACHE.get(path)
+        if entry is None or entry.mtime_ns != st.st_mtime_ns:
+            entry = cache_small_file(
+                path, st, self.guess_type(path), self.date_time_string(st.st_mtime)
+            )
+            if entry is None:
+                return False
+
+        if self.is_not_modified(entry):
+            self.send_response(304)
+            self.send_header("ETag", entry.etag)
+            self.send_header("Last-Modified", entry.last_modified)
+            self.end_headers()
+            return True
+
+        status = (
+            f"{self.protocol_version} 200 OK\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+        ).encode("latin-1")
+        if self.confirm_keep_alive():
+            status += b"Connection: keep-alive\r\n"
+        self.wfile.write(b"".join([status, entry.headers, entry.body]))
+        self.log_request(200, len(entry.body))
+        return True
+
+    def is_not_modified(self, entry):
+        """Evaluate the request's conditional headers against a cached file."""
+        # If-None-Match takes precedence and If-Modified-Since is then ignored
+        # (RFC 9110 13.1.3): the ETag sees sub-second changes, the date doesn't
+        if "If-None-Match" in self.headers:
+            tags = [tag.strip() for tag in self.headers["If-None-Match"].split(",")]
+            return "*" in tags or entry.etag in tags
+
+        if "If-Modified-Since" not in self.headers:
+            return False
+        # Same comparison as SimpleHTTPRequestHandler.send_head()
+        try:
+            ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        if ims.tzinfo is not datetime.timezone.utc:
+            return False
+        last_modif = datetime.datetime.fromtimestamp(
+            entry.mtime_ns / 1e9, datetime.timezone.utc
+        ).replace(microsecond=0)
+        return last_modif <= ims
+
+    def copyfile(self, source, outputfile):
+        try:
+            fd = source.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            # Directory listings are rendered into an in-memory BytesIO
+            shutil.copyfileobj(source, outputfile, COPY_BUFSIZE)
+            return
+        size = os.fstat(fd).st_size
+        if size > SENDFILE_MIN_SIZE and hasattr(os, "sendfile"):
+            # socket.sendfile() loops over os.sendfile() and falls back to
+            # send() itself if the kernel refuses (e.g. a TLS-wrapped socket)
+            self.connection.sendfile(source, 0, size)
+        elif MMAP_MIN_SIZE < size < MMAP_MAX_SIZE:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                outputfile.write(mm)
+        else:
+            shutil.copyfileobj(source, outputfile, COPY_BUFSIZE)
+
+
+def create_app(frontend_dir):
+    """Build the aiohttp application serving the frontend directory."""
+    index_path = os.path.join(frontend_dir, "index.html")
+
+    @web.middleware
+    async def cors_middleware(request, handler):
+        if request.method == "OPTIONS":
+            response = web.Response()
+        else:
+            response = await handler(request)
+        response.headers.update(CORS_HEADERS)
+        return response
+
+    async def index(request):
+        return web.FileResponse(index_path)
+
+    app = web.Application(middlewares=[cors_middleware])
+    app.router.add_get("/", index)
+    app.router.add_static("/", frontend_dir, show_index=True)
+    return app
+
+
+def announce(port):
+    print(f"🌐 Frontend server starting on port {port}")
+    print(f"📁 Serving files from: {os.getcwd()}")
+    print(f"🔗 Frontend URL: http://localhost:{port}")
+    print(f"🎵 TTS Server should be running on: http://localhost:8085")
+    print("\n" + "="*60)
+    print("🚀 TTS PROJECT - FRONTEND INTERFACE")
+    print("="*60)
+    print("📋 Available Features:")
+    print("   • Text-to-Speech synthesis")
+    print("   • Real-time WebSocket streaming")
+    print("   • AI Chat integration")
+    print("   • Server status monitoring")
+    print("="*60)
+    print("\n💡 Make sure your TTS server is running:")
+    print("   cargo run --release -p server")
+    print("\n🌐 Opening browser...")
+
+    webbrowser.open(f"http://localhost:{port}")
+
+    print(f"\n🔄 Server running... Press Ctrl+C to stop")
+
+
+async def serve_aiohttp(port, frontend_dir):
+    runner = web.AppRunner(create_app(frontend_dir))
+    await runner.setup()
+    try:
+        # Bind before announcing so the browser never hits a closed port
+        await web.TCPSite(runner, port=port).start()
+        announce(port)
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def serve_stdlib(port):
+    # One thread per connection, so a slow or idle keep-alive client
+    # doesn't block everyone else
+    with http.server.ThreadingHTTPServer(("", port), CORSHTTPRequestHandler) as httpd:
+        announce(port)
+        httpd.serve_forever()
 
 
 def main(port):
@@ -36,28 +288,12 @@ def main(port):
     os.chdir(frontend_dir)
 
     try:
-        with socketserver.TCPServer(("", PORT), CORSHTTPRequestHandler) as httpd:
-            print(f"🌐 Frontend server starting on port {PORT}")
-            print(f"📁 Serving files from: {os.getcwd()}")
-            print(f"🔗 Frontend URL: http://localhost:{PORT}")
-            print(f"🎵 TTS Server should be running on: http://localhost:8085")
-            print("\n" + "="*60)
-            print("🚀 TTS PROJECT - FRONTEND INTERFACE")
-            print("="*60)
-            print("📋 Available Features:")
-            print("   • Text-to-Speech synthesis")
-            print("   • Real-time WebSocket streaming")
-            print("   • AI Chat integration")
-            print("   • Server status monitoring")
-            print("="*60)
-            print("\n💡 Make sure your TTS server is running:")
-            print("   cargo run --release -p server")
-            print("\n🌐 Opening browser...")
-            
-            webbrowser.open(f"http://localhost:{PORT}")
-
-            print(f"\n🔄 Server running... Press Ctrl+C to stop")
-            httpd.serve_forever()
+        if web is not None:
+            # uvloop.run() only exists from uvloop 0.18 on
+            run = getattr(uvloop, "run", None) or asyncio.run
+            run(serve_aiohttp(PORT, frontend_dir))
+        else:
+            serve_stdlib(PORT)
 
     except OSError as e:
         if e.errno == 48:
@@ -1,9 +1,20 @@
 # scripts/download_voices.py
+from concurrent.futures import ThreadPoolExecutor
 from huggingface_hub import snapshot_download
 from pathlib import Path
+import os
 import shutil
 import sys
 
+try:
+    # requests-based HTTP backend of huggingface_hub < 1.0
+    import requests
+    from huggingface_hub import configure_http_backend, constants
+    from huggingface_hub.utils._http import UniqueRequestIdAdapter
+except ImportError:
+    # huggingface_hub >= 1.0 already shares one httpx client process-wide
+    configure_http_backend = None
+
 # IMPORTANT: this is a *model* repo, not a dataset repo
 REPO_ID = "rhasspy/piper-voices"
 REPO_TYPE = "model"  # <-- fix
@@ -22,11 +33,82 @@ VOICE_DIRS = [
     # Add more from VOICES.md as needed...
 ]
 
+# Downloads are network-bound: fetch several voices at once, and let each
+# snapshot_download pull its own files in parallel too.
+MAX_WORKERS = 8
+
+def share_connection_pool():
+    """Make every download thread use one connection pool to huggingface.co."""
+    # Offline mode keeps the default factory, whose OfflineAdapter fails fast
+    if configure_http_backend is None or constants.HF_HUB_OFFLINE:
+        return
+
+    # TCP+TLS connections are reused across files and voices. huggingface_hub
+    # still builds a Session per thread (Sessions aren't thread-safe) but they
+    # all mount this adapter, whose urllib3 pool is. UniqueRequestIdAdapter
+    # is what the default factory mounts, so request IDs are kept.
+    adapter = UniqueRequestIdAdapter(pool_maxsize=MAX_WORKERS * MAX_WORKERS)
+
+    def make_session() -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    configure_http_backend(backend_factory=make_session)
+
+def iter_voice_files(root: str):
+    """Yield DirEntry objects for the .onnx/.onnx.json files under root."""
+    # scandir reports entry types from readdir itself, so walking and
+    # filtering by name needs no per-entry stat(). os.walk would stat every
+    # symlink (i.e. every file in an HF snapshot) just to classify it.
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith((".onnx", ".onnx.json")):
+                    yield entry
+
+def link_or_copy(src: str, target: Path):
+    """Hard-link src to target, falling back to an in-kernel copy."""
+    target.unlink(missing_ok=True)
+    try:
+        # Same filesystem as the HF cache: no data is copied at all. Snapshot
+        # files are relative symlinks into blobs/ and link() doesn't follow
+        # them (not even with follow_symlinks=True on Linux), so link the blob.
+        os.link(os.path.realpath(src), target)
+        if target.exists():
+            return
+        target.unlink()
+    except OSError:
+        pass
+
+    if hasattr(os, "copy_file_range"):
+        # Linux: copy inside the kernel (a reflink on btrfs/XFS)
+        try:
+            with open(src, "rb") as fsrc, open(target, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+            # Short copy: let shutil redo it rather than leave a truncated file
+        except OSError:
+            pass
+
+    shutil.copyfile(src, target)
+
 def download_dir(prefix_repo_dir: str, out_lang: str):
     print(f"\n>>> Downloading for {out_lang} from '{prefix_repo_dir}' ...")
     cache_dir = snapshot_download(
         repo_id=REPO_ID,
         repo_type=REPO_TYPE,
+        max_workers=MAX_WORKERS,
         allow_patterns=[
             f"{prefix_repo_dir}/*.onnx",
             f"{prefix_repo_dir}/*.onnx.json",
@@ -36,13 +118,17 @@ def download_dir(prefix_repo_dir: str, out_lang: str):
     outdir.mkdir(parents=True, exist_ok=True)
 
     copied = 0
-    for p in Path(cache_dir).rglob("*"):
-        if p.suffix == ".onnx" or p.name.endswith(".onnx.json"):
-            target = outdir / p.name
-            shutil.copy2(p, target)
-            size_mb = target.stat().st_size / (1024 * 1024)
-            print(f"Saved {target} ({size_mb:.1f} MB)")
-            copied += 1
+    # snapshot_download returns the snapshot root shared by all voices, and
+    # other workers may be writing into it: only walk this voice's folder
+    voice_dir = os.path.join(cache_dir, prefix_repo_dir)
+    entries = iter_voice_files(voice_dir) if os.path.isdir(voice_dir) else ()
+    for entry in entries:
+        target = outdir / entry.name
+        link_or_copy(entry.path, target)
+        # HF snapshot files are symlinks into blobs/, so follow them for the size
+        size_mb = entry.stat().st_size / (1024 * 1024)
+        print(f"Saved {target} ({size_mb:.1f} MB)")
+        copied += 1
 
     if copied == 0:
         print(f"ERROR: No .onnx or .onnx.json under '{prefix_repo_dir}'.", file=sys.stderr)
@@ -50,8 +136,12 @@ def download_dir(prefix_repo_dir: str, out_lang: str):
         sys.exit(1)
 
 def main():
-    for lang, prefix in VOICE_DIRS:
-        download_dir(prefix, lang)
+    share_connection_pool()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = [ex.submit(download_dir, prefix, lang) for lang, prefix in VOICE_DIRS]
+        for future in futures:
+            # Re-raises any failure (including sys.exit) from the worker
+            future.result()
     print("\nDone. Check the models/ folders for files.")
 
 if __name__ == "__main__":
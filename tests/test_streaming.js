@@ -33,53 +33,93 @@ let audioChunkCount = 0;
 let fullText = '';
 let startTime = Date.now();
 
+// Tokens arriving in the same event-loop turn are written to stdout in one
+// go instead of one write per token.
+let pendingTokens = [];
+let flushScheduled = false;
+
+function flushTokens() {
+    flushScheduled = false;
+    if (pendingTokens.length > 0) {
+        process.stdout.write(pendingTokens.join(''));
+        pendingTokens = [];
+    }
+}
+
 ws.on('open', () => {
     console.log('✅ WebSocket connected\n');
     startTime = Date.now();
 });
 
-ws.on('message', (data) => {
+function onStatus(message) {
+    console.log(`📊 Status: ${message.status} - ${message.message || ''}`);
+    if (message.status === 'complete') {
+        console.log(`\n📝 Full text: ${message.text || fullText}`);
+    }
+}
+
+function onToken(message) {
+    tokenCount++;
+    fullText = message.text || fullText;
+    pendingTokens.push(message.token);
+    if (!flushScheduled) {
+        flushScheduled = true;
+        setImmediate(flushTokens);
+    }
+}
+
+function onAudioChunk(message) {
+    audioChunkCount++;
+    const audioSize = message.audio ? Math.round(message.audio.length / 1024) : 0;
+    console.log(`\n🔊 Audio chunk #${audioChunkCount} (${audioSize}KB, ${message.sample_rate}Hz)`);
+}
+
+function onError(message) {
+    console.error(`\n❌ Error: ${message.error}`);
+}
+
+function onUnknown(message) {
+    console.log(`\n⚠️  Unknown message type: ${message.type}`, message);
+}
+
+// Message handlers keyed by type: one lookup per frame instead of a switch
+const HANDLERS = new Map([
+    ['status', onStatus],
+    ['token', onToken],
+    ['audio_chunk', onAudioChunk],
+    ['error', onError],
+]);
+
+ws.on('message', (data, isBinary) => {
+    if (isBinary) {
+        // Raw audio sent as a binary frame: no base64 or JSON envelope to decode
+        flushTokens();
+        audioChunkCount++;
+        console.log(`\n🔊 Audio chunk #${audioChunkCount} (${Math.round(data.length / 1024)}KB, binary)`);
+        return;
+    }
+
     try {
         const message = JSON.parse(data.toString());
-        
-        switch (message.type) {
-            case 'status':
-                console.log(`📊 Status: ${message.status} - ${message.message || ''}`);
-                if (message.status === 'complete') {
-                    console.log(`\n📝 Full text: ${message.text || fullText}`);
-                }
-                break;
-                
-            case 'token':
-                tokenCount++;
-                fullText = message.text || fullText;
-                process.stdout.write(message.token);
-                break;
-                
-            case 'audio_chunk':
-                audioChunkCount++;
-                const audioSize = message.audio ? Math.round(message.audio.length / 1024) : 0;
-                console.log(`\n🔊 Audio chunk #${audioChunkCount} (${audioSize}KB, ${message.sample_rate}Hz)`);
-                break;
-                
-            case 'error':
-                console.error(`\n❌ Error: ${message.error}`);
-                break;
-                
-            default:
-                console.log(`\n⚠️  Unknown message type: ${message.type}`, message);
+        const handler = HANDLERS.get(message.type) || onUnknown;
+        if (handler !== onToken) {
+            flushTokens();
         }
+        handler(message);
     } catch (error) {
+        flushTokens();
         console.error(`\n❌ Error parsing message: ${error.message}`);
         console.error(`Raw data: ${data.toString().substring(0, 200)}`);
     }
 });
 
 ws.on('error', (error) => {
+    flushTokens();
     console.error(`\n❌ WebSocket error: ${error.message}`);
 });
 
 ws.on('close', (code, reason) => {
+    flushTokens();
     const duration = ((Date.now() - startTime) / 1000).toFixed(2);
     console.log(`\n---\n✅ Connection closed`);
     console.log(`   Code: ${code}`);
@@ -93,6 +133,7 @@ ws.on('close', (code, reason) => {
 
 // Handle Ctrl+C
 process.on('SIGINT', () => {
+    flushTokens();
     console.log('\n\n⚠️  Interrupted by user');
     ws.close();
     process.exit(1);
@@ -100,6 +141,7 @@ process.on('SIGINT', () => {
 
 // Timeout after 60 seconds
 setTimeout(() => {
+    flushTokens();
     console.log('\n\n⏱️  Timeout after 60 seconds');
     ws.close();
     process.exit(1);